@@ -29,7 +29,10 @@ import re
 import shutil
 import subprocess
 from pathlib import Path
+from collections import defaultdict
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 
 # ═══════════════════════════════════════════
 # Dashboard webhook
@@ -82,6 +85,8 @@ TYPES = [
     ("SoonsalCardnews",   "english-card","english",     ""),
     ("SoonsalCrypto",     "english",     "english",     ""),
 ]
+# detect_type fast path: 파일명 앞부분 startswith 매칭 (긴 접두어 우선)
+_TYPES_SORTED = sorted(TYPES, key=lambda t: len(t[0]), reverse=True)
 
 # Tags for main index.html
 MAIN_TAGS = {
@@ -168,8 +173,6 @@ BACK_LINK_NEW = (
 
 def fix_back_link(filepath):
     """Replace or inject back-to-letters link with ← 순살 홈 (orange style)."""
-    import re as _re
-
     with open(filepath, "r", encoding="utf-8") as f:
         html = f.read()
 
@@ -194,12 +197,12 @@ def fix_back_link(filepath):
         return
 
     # Marker exists — replace the <a> inside with orange style
-    new_html = _re.sub(
+    new_html = re.sub(
         r'(<div[^>]*id="back-to-letters"[^>]*>\s*)<a[^>]*>.*?</a>',
         r'\1' + BACK_LINK_NEW,
         html,
         count=1,
-        flags=_re.DOTALL,
+        flags=re.DOTALL,
     )
 
     if new_html != html:
@@ -211,8 +214,36 @@ def fix_back_link(filepath):
 # Helpers
 # ═══════════════════════════════════════════
 
+# 배포마다 파일 수만큼 호출되므로 패턴은 모듈 로드 시 한 번만 컴파일
+_DATE_RE = re.compile(r"(\d{4})(\d{2})(\d{2})(?:[_\-](\d+))?")
+_TITLE_RE = re.compile(r"<title>(.*?)</title>")
+_META_KW_RE = re.compile(r'<meta\s+name="soonsal-keywords"\s+content="([^"]+)"')
+_STORY_TITLE_RE = re.compile(r'<h2 class="story-title">(.*?)</h2>', re.DOTALL)
+_HERO_RE = re.compile(r"Latest &mdash; (\d{4})\.(\d{2})\.(\d{2})")
+_FIRST_TODAY_RE = re.compile(
+    r'<div class="today"[^>]*>\s*<div class="today-title">'
+    r"(\d{4}\.\d{2}\.\d{2}) 전체 콘텐츠</div>"
+)
+_TODAY_OPEN_RE = re.compile(r'<div class="today"[^>]*>')
+
+# 배포 경로(resolve) → 추출된 키워드. 같은 파일을 디스크에서 다시 읽고 파싱하지 않도록 캐시
+_keyword_cache: dict[Path, str] = {}
+
+
+def cached_keywords(path, ctype):
+    """Return keywords for a repo HTML file, reading and parsing it at most once per run."""
+    key = Path(path).resolve()
+    if key not in _keyword_cache:
+        _keyword_cache[key] = extract_keywords(key.read_bytes().decode("utf-8"), ctype)
+    return _keyword_cache[key]
+
+
 def detect_type(filename):
     """Detect content type from filename pattern."""
+    for prefix, ctype, directory, suffix in _TYPES_SORTED:
+        if filename.startswith(prefix):
+            return ctype, directory, suffix
+    # 접두어가 앞에 없는 파일명(복사본 등)은 기존 부분 문자열 검색으로 폴백
     for prefix, ctype, directory, suffix in TYPES:
         if prefix in filename:
             return ctype, directory, suffix
@@ -225,7 +256,20 @@ def extract_date(filename):
     '순살카드뉴스_20260313_2.html'  → ('2026', '0313', '2026.03.13', '-2')
     '순살카드뉴스_20260317-2.html'  → ('2026', '0317', '2026.03.17', '-2')
     """
-    m = re.search(r"(\d{4})(\d{2})(\d{2})(?:[_\-](\d+))?", filename)
+    # Fast path: 표준 명명 규칙 "<prefix>_YYYYMMDD[_N|-N].html" 은 슬라이싱으로 처리
+    stem = filename.rsplit(".", 1)[0]
+    rest = stem.partition("_")[2]
+    date = rest[:8]
+    if len(date) == 8 and date.isascii() and date.isdigit():
+        yyyy, mm, dd = date[:4], date[4:6], date[6:]
+        tail = rest[8:]
+        num = tail[1:] if tail[:1] in ("_", "-") else ""
+        num = num[:len(num) - len(num.lstrip("0123456789"))]
+        file_suffix = f"-{num}" if num else ""
+        return yyyy, mm + dd, f"{yyyy}.{mm}.{dd}", file_suffix
+
+    # 비표준 파일명은 기존 정규식으로 폴백
+    m = _DATE_RE.search(filename)
     if m:
         yyyy, mm, dd = m.group(1), m.group(2), m.group(3)
         num_suffix = m.group(4)
@@ -234,6 +278,28 @@ def extract_date(filename):
     return None, None, None, None
 
 
+def _strip_tags(s):
+    """Remove <...> tags from s — same result as re.sub(r"<[^>]+>", "", s)."""
+    chunks = []
+    start = 0
+    while True:
+        i = s.find("<", start)
+        if i < 0:
+            break
+        j = s.find(">", i + 1)
+        if j < 0:
+            break
+        if j == i + 1:
+            # "<>" is not a tag — keep the "<" and scan on
+            chunks.append(s[start:i + 1])
+            start = i + 1
+            continue
+        chunks.append(s[start:i])
+        start = j + 1
+    chunks.append(s[start:])
+    return "".join(chunks)
+
+
 def extract_keywords(html, ctype):
     """Extract display title from HTML content for index entry.
 
@@ -242,10 +308,11 @@ def extract_keywords(html, ctype):
       2. <meta name="soonsal-keywords"> fallback (SEO keywords)
       3. <h2 class="story-title"> extraction (briefing, crypto)
     """
+    # 정규식 전에 리터럴 `in` 검사로 마커 없는 문서는 스캔을 건너뜀
     # ── Priority 1: <title> tag (v16 — meme title for index) ──
-    m = re.search(r"<title>(.*?)</title>", html)
+    m = _TITLE_RE.search(html) if "<title>" in html else None
     if m:
-        t = re.sub(r"<[^>]+>", "", m.group(1)).strip()
+        t = _strip_tags(m.group(1)).strip()
         # "밈 제목 — 순살브리핑 2026.03.04" → "밈 제목"
         # rsplit: 마지막 " — " 기준으로만 분리 (제목 안의 — 는 보존)
         parts = t.rsplit(" — ", 1)
@@ -255,28 +322,77 @@ def extract_keywords(html, ctype):
         return t
 
     # ── Priority 2: soonsal-keywords fallback (SEO) ──
-    m = re.search(r'<meta\s+name="soonsal-keywords"\s+content="([^"]+)"', html)
+    m = _META_KW_RE.search(html) if "soonsal-keywords" in html else None
     if m:
         return m.group(1).strip()
 
     # ── Priority 3: story-title extraction (briefing / crypto) ──
-    titles = re.findall(r'<h2 class="story-title">(.*?)</h2>', html)
-    if titles:
+    if "story-title" in html:
         kws = []
-        for t in titles:
-            clean = re.sub(r"<[^>]+>", "", t).strip()
-            for sep in [" — ", "—"]:
-                if sep in clean:
-                    clean = clean.split(sep)[0].strip()
-                    break
-            else:
+        for m in _STORY_TITLE_RE.finditer(html):
+            # 여러 줄에 걸친 제목도 인덱스 링크는 한 줄이어야 함(줄 단위 dedup)
+            clean = " ".join(_strip_tags(m.group(1)).split())
+            # " — " 도 "—" 를 포함하므로 구분자 없는 제목은 검사 한 번으로 끝남
+            if "—" not in clean:
                 clean = clean[:40].strip()
+            else:
+                sep = " — " if " — " in clean else "—"
+                clean = clean.split(sep, 1)[0].strip()
             kws.append(clean)
-        return ", ".join(kws)
+        if kws:
+            return ", ".join(kws)
 
     return "Untitled"
 
 
+def _splice(c, edits):
+    """Apply (start, end, text) edits to c in a single join.
+
+    Offsets refer to the original string; start == end is a pure insert.
+    Edits must not overlap. Edits sharing a start offset keep the order
+    given, so an insert listed before a replacement lands in front of it.
+    """
+    chunks = []
+    pos = 0
+    for start, end, text in sorted(edits, key=itemgetter(0)):
+        chunks.append(c[pos:start])
+        chunks.append(text)
+        pos = end
+    chunks.append(c[pos:])
+    return "".join(chunks)
+
+
+def read_head_for_keywords(path, chunk_size=16 * 1024):
+    """Read only as much of an HTML file as extract_keywords needs.
+
+    Stops once </head> has been read and the <title> match (priority 1) is
+    already in the buffer; a match there is the same one a full read would
+    find. Files without it (story-title pages) are read to the end.
+    """
+    text = ""
+    with open(path, encoding="utf-8") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return text
+            text += chunk
+            if "</head>" in text[-(len(chunk) + 6):] and _TITLE_RE.search(text):
+                return text
+
+
+def _dedup_by_path(items):
+    """Keep one item per deploy_path — the last one, at its last position.
+
+    Same result as the old per-item "remove then insert" loop when a file is
+    passed twice in one deploy.
+    """
+    uniq = {}
+    for item in items:
+        uniq.pop(item["deploy_path"], None)
+        uniq[item["deploy_path"]] = item
+    return list(uniq.values())
+
+
 def build_link(href, tag, label, keywords):
     """Build an <a> tag for the index."""
     text = f"{label} · {keywords}" if label else keywords
@@ -285,7 +401,7 @@ def build_link(href, tag, label, keywords):
 
 def get_hero_info(content):
     """Get current Hero date from main index."""
-    m = re.search(r"Latest &mdash; (\d{4})\.(\d{2})\.(\d{2})", content)
+    m = _HERO_RE.search(content)
     if m:
         yyyy, mm, dd = m.group(1), m.group(2), m.group(3)
         return yyyy, mm + dd, f"{yyyy}.{mm}.{dd}"
@@ -298,11 +414,7 @@ def get_first_today_date(content):
     ⚠️ 과거엔 style 없는 형태만 매칭해서, 첫 섹션이 padding-top:0으로 강등된
     상태로 남으면(한 번의 삽입 실패 잔재) 이후 모든 발행에서 새 날짜 섹션
     생성이 영구 스킵되는 연쇄 고장이 있었음(0720~0803 grid 동결 원인)."""
-    m = re.search(
-        r'<div class="today"[^>]*>\s*<div class="today-title">'
-        r"(\d{4}\.\d{2}\.\d{2}) 전체 콘텐츠</div>",
-        content,
-    )
+    m = _FIRST_TODAY_RE.search(content)
     return m.group(1) if m else None
 
 
@@ -310,13 +422,15 @@ def get_first_today_date(content):
 # Main index update
 # ═══════════════════════════════════════════
 
-def update_main_index(items, date_fmt, has_briefing, yyyy, mmdd):
-    """Update the main index.html."""
-    path = REPO / "index.html"
-    with open(path, "r") as f:
-        c = f.read()
+def apply_main_index_edits(c, items, date_fmt, has_briefing, yyyy, mmdd):
+    """Apply one date's items to the main index.html content and return it.
 
-    date_exists = f"{date_fmt} 전체 콘텐츠" in c
+    Pure string transform — main() reads index.html once, applies every
+    date in turn, and writes the result back once.
+    """
+    date_marker = f"{date_fmt} 전체 콘텐츠"
+    date_pos = c.find(date_marker)
+    date_exists = date_pos >= 0
     old_yyyy, old_mmdd, old_date_fmt = get_hero_info(c)
 
     # ── Step 1: Briefing → update Hero + add old briefing link ──
@@ -334,9 +448,7 @@ def update_main_index(items, date_fmt, has_briefing, yyyy, mmdd):
         # Add old briefing link to old Hero date's today section
         old_brief_path = REPO / "newsletters" / old_yyyy / f"{old_mmdd}.html"
         if old_brief_path.exists():
-            with open(old_brief_path) as f:
-                old_html = f.read()
-            old_kw = extract_keywords(old_html, "briefing")
+            old_kw = cached_keywords(old_brief_path, "briefing")
             old_brief_link = build_link(
                 f"/newsletters/{old_yyyy}/{old_mmdd}.html",
                 MAIN_TAGS["briefing"],
@@ -368,17 +480,17 @@ def update_main_index(items, date_fmt, has_briefing, yyyy, mmdd):
                     f"  </div>\n"
                     f"</div>"
                 )
-                m_first = re.search(r'<div class="today"[^>]*>', c)
+                m_first = _TODAY_OPEN_RE.search(c)
                 if m_first:
                     c = c[:m_first.start()] + new_old + "\n\n" + c[m_first.start():]
 
     # ── Step 2: Create or append to today section ──
     if not date_exists:
         # Build new today block (non-briefing items only)
-        non_brief = sorted(
+        non_brief = _dedup_by_path(sorted(
             [i for i in items if i["type"] != "briefing"],
-            key=lambda x: ORDER[x["type"]],
-        )
+            key=itemgetter("order"),
+        ))
 
         new_today = None
         if non_brief:
@@ -406,82 +518,91 @@ def update_main_index(items, date_fmt, has_briefing, yyyy, mmdd):
             if dpos >= 0:
                 head = c[dpos:tpos]
                 if 'padding-top:0' not in head:
-                    c = (c[:dpos]
-                         + head.replace('<div class="today">',
+                    head = head.replace('<div class="today">',
                                         '<div class="today" style="padding-top:0;">', 1)
-                         + c[tpos:])
-                    tpos = c.find(title_marker)
-                    dpos = c.rfind('<div class="today"', 0, tpos)
-                c = c[:dpos] + f"{new_today}\n\n" + c[dpos:]
+                # 새 섹션 삽입 + 기존 첫 섹션 강등을 한 번의 join으로 처리
+                c = _splice(c, [(dpos, dpos, f"{new_today}\n\n"), (dpos, tpos, head)])
     else:
         # Date exists → clean existing links of same type, then insert fresh
-        for item in sorted(items, key=lambda x: ORDER[x["type"]]):
-            if item["type"] == "briefing":
-                continue
-            # Remove existing link for same deploy_path (dedup)
-            # ⚠️ 줄 단위 삭제 시 nav 등 관계없는 줄이 삭제되지 않도록
-            # today-grid 내부(들여쓰기 4칸+)의 링크만 제거
-            href_match = f'<a href="/{item["deploy_path"]}"'
+        fresh = _dedup_by_path(
+            i for i in sorted(items, key=itemgetter("order")) if i["type"] != "briefing"
+        )
+        # Remove existing links for same deploy_path (dedup) — 한 번의 줄 필터로 처리
+        # ⚠️ 줄 단위 삭제 시 nav 등 관계없는 줄이 삭제되지 않도록
+        # today-grid 내부(들여쓰기 4칸+)의 링크만 제거
+        href_matches = tuple(f'<a href="/{i["deploy_path"]}"' for i in fresh)
+        if href_matches:
             lines = c.split('\n')
             c = '\n'.join(
                 line for line in lines
-                if not (line.strip().startswith(href_match) and line.startswith('    '))
-            )
-            # Build fresh link
-            link = build_link(
-                "/" + item["deploy_path"],
-                MAIN_TAGS[item["type"]],
-                LABELS[item["type"]],
-                item["keywords"],
+                if not (line.strip().startswith(href_matches) and line.startswith('    '))
             )
-            pos = c.find(f"{date_fmt} 전체 콘텐츠")
-            if pos >= 0:
-                # Find the today-grid opening after this date marker
-                grid_open = c.find('today-grid', pos)
-                if grid_open >= 0:
-                    # Find the first </div> that closes the today-grid
-                    grid_end = c.find("  </div>", grid_open)
-                    if grid_end >= 0:
-                        c = c[:grid_end] + f"    {link}\n" + c[grid_end:]
+            # Step 1·dedup이 앞쪽 오프셋을 바꿨을 수 있으므로 한 번만 다시 찾음.
+            # 이후 삽입은 모두 date_pos 뒤쪽이라 date_pos는 그대로 유효.
+            date_pos = c.find(date_marker)
+        # Build fresh links — 같은 grid 끝에 들어가므로 한 블록으로 모아 한 번에 삽입
+        block = "".join(
+            f"    {build_link('/' + i['deploy_path'], MAIN_TAGS[i['type']], LABELS[i['type']], i['keywords'])}\n"
+            for i in fresh
+        )
+        if block and date_pos >= 0:
+            # Find the today-grid opening after this date marker
+            grid_open = c.find('today-grid', date_pos)
+            if grid_open >= 0:
+                # Find the first </div> that closes the today-grid
+                grid_end = c.find("  </div>", grid_open)
+                if grid_end >= 0:
+                    c = c[:grid_end] + block + c[grid_end:]
 
-    with open(path, "w") as f:
-        f.write(c)
-    print("  ✅ index.html")
+    return c
 
 
 # ═══════════════════════════════════════════
 # Archive index update
 # ═══════════════════════════════════════════
 
-def update_archive_index(item):
-    """Update the relevant archive index (newsletters, cardnews, or english)."""
-    archive_path = REPO / item["directory"] / "index.html"
+def update_archive_index(directory, items):
+    """Update one archive index (newsletters, cardnews, or english) with all of its items.
+
+    The file is read once, every item is applied in memory, and it is written once.
+    """
+    archive_path = REPO / directory / "index.html"
     if not archive_path.exists():
-        print(f"  ⚠️  {item['directory']}/index.html not found, skipping")
+        print(f"  ⚠️  {directory}/index.html not found, skipping")
         return
 
-    with open(archive_path, "r") as f:
-        c = f.read()
+    c = archive_path.read_bytes().decode("utf-8")
+    by_date = defaultdict(list)
+    for item in items:
+        by_date[item["date_formatted"]].append(item)
+    for date_str, date_items in by_date.items():
+        c = _apply_archive_edit(c, date_str, _dedup_by_path(date_items))
 
+    archive_path.write_bytes(c.encode("utf-8"))
+    print(f"  ✅ {directory}/index.html")
+
+
+def _apply_archive_edit(c, date_str, items):
+    """Insert one date's item links into archive index content and return it.
+
+    All links for the date go into the grid as a single block (one splice).
+    """
     # Archive uses date without "전체 콘텐츠"
-    date_str = item["date_formatted"]
     date_exists = f'<div class="today-title">{date_str}</div>' in c
 
-    link = build_link(
-        "/" + item["deploy_path"],
-        ARCHIVE_TAGS[item["type"]],
-        LABELS[item["type"]],
-        item["keywords"],
+    links = "".join(
+        f"      {build_link('/' + i['deploy_path'], ARCHIVE_TAGS[i['type']], LABELS[i['type']], i['keywords'])}\n"
+        for i in items
     )
 
     if date_exists:
-        # Clean existing link for same deploy_path, then insert fresh (dedup)
+        # Clean existing links for same deploy_path, then insert fresh (dedup)
         # ⚠️ nav 등 관계없는 줄이 삭제되지 않도록 today-grid 내 링크만 제거
-        href_match = f'<a href="/{item["deploy_path"]}"'
+        href_matches = tuple(f'<a href="/{i["deploy_path"]}"' for i in items)
         lines = c.split('\n')
         c = '\n'.join(
             line for line in lines
-            if not (line.strip().startswith(href_match) and line.startswith('      '))
+            if not (line.strip().startswith(href_matches) and line.startswith('      '))
         )
         pos = c.find(f'<div class="today-title">{date_str}</div>')
         if pos >= 0:
@@ -503,26 +624,22 @@ def update_archive_index(item):
                         break
                     search_pos = candidate + 6
                 if grid_end >= 0:
-                    c = c[:grid_end] + f"      {link}\n" + c[grid_end:]
+                    c = c[:grid_end] + links + c[grid_end:]
     else:
         # New date section → insert before first <div class="today">
-        import re as _re
-        m = _re.search(r'<div class="today">', c)
-        if m:
-            first_today = m.start()
+        first_today = c.find('<div class="today">')
+        if first_today >= 0:
             new_section = (
                 f'<div class="today">\n'
                 f'    <div class="today-title">{date_str}</div>\n'
                 f'    <div class="today-grid" style="grid-template-columns:1fr; gap:10px;">\n'
-                f"      {link}\n"
+                f"{links}"
                 f"    </div>\n"
                 f"  </div>\n\n\n"
             )
             c = c[:first_today] + new_section + c[first_today:]
 
-    with open(archive_path, "w") as f:
-        f.write(c)
-    print(f"  ✅ {item['directory']}/index.html")
+    return c
 
 
 # ═══════════════════════════════════════════
@@ -812,18 +929,17 @@ IG_CAPTIONS = {
 
 def parse_cardnews_content(html: str) -> list[dict]:
     """카드뉴스 HTML에서 각 카드의 제목 + 핵심 본문 추출."""
-    import re as _re
     results = []
-    card_blocks = _re.findall(
+    card_blocks = re.findall(
         r'<div[^>]*class="[^"]*\bcard\b[^"]*"[^>]*>(.*?)(?=<div[^>]*class="[^"]*\bcard\b|</body|$)',
-        html, _re.DOTALL
+        html, re.DOTALL
     )
     for block in card_blocks:
-        title_m = _re.search(r'<(?:h[1-4])[^>]*>(.*?)</(?:h[1-4])>', block, _re.DOTALL)
-        title = _re.sub(r"<[^>]+>", "", title_m.group(1)).strip() if title_m else ""
-        paras = _re.findall(r'<p[^>]*>(.*?)</p>', block, _re.DOTALL)
+        title_m = re.search(r'<(?:h[1-4])[^>]*>(.*?)</(?:h[1-4])>', block, re.DOTALL)
+        title = re.sub(r"<[^>]+>", "", title_m.group(1)).strip() if title_m else ""
+        paras = re.findall(r'<p[^>]*>(.*?)</p>', block, re.DOTALL)
         body = " ".join(
-            _re.sub(r"\s+", " ", _re.sub(r"<[^>]+>", "", p)).strip()
+            re.sub(r"\s+", " ", re.sub(r"<[^>]+>", "", p)).strip()
             for p in paras if p.strip()
         )[:150]
         if title or body:
@@ -886,13 +1002,11 @@ def build_ig_summary(keywords: str, ctype: str, html: str = "", date_fmt: str =
     2. Claude Haiku API 생성 (ANTHROPIC_API_KEY 있을 때)
     3. keywords fallback
     """
-    import re as _re
-
     # 1순위: 미리 작성된 ig-caption 메타 태그
     if html:
-        m = _re.search(r'<meta[^>]+name="soonsal-ig-caption"[^>]+content="([^"]+)"', html)
+        m = re.search(r'<meta[^>]+name="soonsal-ig-caption"[^>]+content="([^"]+)"', html)
         if not m:
-            m = _re.search(r'<meta[^>]+content="([^"]+)"[^>]+name="soonsal-ig-caption"', html)
+            m = re.search(r'<meta[^>]+content="([^"]+)"[^>]+name="soonsal-ig-caption"', html)
         if m:
             caption = m.group(1).strip()
             print(f"  📋 ig-caption 메타 태그 사용")
@@ -908,7 +1022,7 @@ def build_ig_summary(keywords: str, ctype: str, html: str = "", date_fmt: str =
     # 3순위: keywords fallback
     if not keywords or keywords == "Untitled":
         return ""
-    items = [k.strip() for k in _re.split(r"[,\n]+", keywords) if k.strip()]
+    items = [k.strip() for k in re.split(r"[,\n]+", keywords) if k.strip()]
     emoji = "📊" if ctype == "crypto-card" else "📌"
     return "\n".join(f"{emoji} {item}" for item in items[:3])
 
@@ -960,7 +1074,6 @@ def upload_to_r2(png_paths, r2_prefix):
     except Exception as e:
         print(f"  ❌ R2 업로드 실패: {e}")
         # fallback: upload_r2.py와 동일한 파일명 규칙 적용 (card_01.png → 01.png)
-        import re
         public_url = os.environ.get("R2_PUBLIC_URL", "https://pub-cb0321b52a854a95af8d6bb1688b2ecd.r2.dev").rstrip("/")
         urls = []
         for p in png_paths:
@@ -970,12 +1083,16 @@ def upload_to_r2(png_paths, r2_prefix):
         return urls
 
 
-def git_sync_push(commit_msg, tries=6):
+def git_sync_push(commit_msg, tries=6, paths=None):
     """동시 push 안전 커밋+푸시. 다른 작업이 origin을 진행시켜도 실패하지 않도록
     add -A → commit → (pull --rebase, 충돌 시 merge -X ours) → push 를 백오프 재시도.
     콘텐츠 파일(카드뉴스 페이지·_queue)은 슬러그별 고유라 충돌 없음. 파생파일(index/SEO)은
-    우리 재생성본을 유지(-X ours)해 자기치유. 최종 실패해도 예외 없이 False 반환(호출부가 계속 진행)."""
-    subprocess.run(["git", "add", "-A"])
+    우리 재생성본을 유지(-X ours)해 자기치유. 최종 실패해도 예외 없이 False 반환(호출부가 계속 진행).
+    paths를 주면 워크트리 전체 스캔 대신 해당 파일만 add (없는 경로는 제외)."""
+    pathspec = []
+    if paths is not None:
+        pathspec = ["--", *(p for p in dict.fromkeys(paths) if Path(p).exists())]
+    subprocess.run(["git", "add", "-A", *pathspec])
     committed = subprocess.run(["git", "commit", "-m", commit_msg]).returncode == 0
     for i in range(tries):
         rb = subprocess.run(["git", "pull", "--rebase", "origin", "main"],
@@ -1111,6 +1228,35 @@ def publish_cardnews_to_instagram(png_paths, ctype, yyyy, mmdd, date_fmt, keywor
             print(f"  📡 Dashboard: {pipeline}.instagram → done")
             return True
     return False
+
+
+def _read_input(arg):
+    """Resolve, classify and read one input file; extract its keywords.
+
+    Only reads — no repo writes — so main() can run it across files in a
+    thread pool. Returns (filepath, info) with info=None for unparseable names.
+    """
+    filepath = Path(arg).expanduser().resolve()
+    filename = filepath.name
+
+    ctype, directory, suffix = detect_type(filename)
+    yyyy, mmdd, date_fmt, file_suffix = extract_date(filename)
+
+    if not ctype or not yyyy:
+        return filepath, None
+
+    # 카드뉴스·짤은 본문 전체가 IG 캡션/패킹에 쓰이므로 전체 읽기
+    if ctype in CARDNEWS_TYPES or ctype in ZZAL_TYPES:
+        html = filepath.read_bytes().decode("utf-8")
+    else:
+        html = read_head_for_keywords(filepath)
+
+    return filepath, {
+        "type": ctype, "directory": directory, "suffix": suffix,
+        "yyyy": yyyy, "mmdd": mmdd, "date_formatted": date_fmt,
+        "file_suffix": file_suffix, "html": html,
+        "keywords": extract_keywords(html, ctype),
+    }
 # ═══════════════════════════════════════════
 
 def main():
@@ -1143,26 +1289,36 @@ def main():
     if instagram_only:
         print("⏭️  웹 발행 스킵 (--instagram-only)")
     else:
-        print("📦 git pull...")
-        subprocess.run(["git", "pull", "origin", "main"], check=True)
+        # ls-remote는 객체 전송 없이 1회 왕복 → 이미 최신이면 pull(fetch 협상) 생략
+        remote = subprocess.run(["git", "ls-remote", "origin", "refs/heads/main"],
+                                capture_output=True, text=True).stdout.split()
+        local = subprocess.run(["git", "rev-parse", "HEAD"],
+                               capture_output=True, text=True).stdout.strip()
+        if remote and remote[0] == local:
+            print("📦 git pull 스킵 (이미 최신)")
+        else:
+            print("📦 git pull...")
+            if subprocess.run(["git", "pull", "--ff-only", "origin", "main"]).returncode != 0:
+                # 로컬 커밋과 갈라진 경우 — 기존처럼 merge pull
+                subprocess.run(["git", "pull", "origin", "main"], check=True)
 
     # ── Parse and copy files ──
+    # 읽기+키워드 추출만 병렬 (map은 입력 순서 유지). 복사·짤 번호 매기기·PNG 생성은
+    # 저장소에 쓰므로 아래에서 순차 처리.
+    with ThreadPoolExecutor(max_workers=min(8, len(file_args))) as ex:
+        parsed = list(ex.map(_read_input, file_args))
+
     items = []
-    for filepath in file_args:
-        filepath = Path(filepath).expanduser().resolve()
+    for filepath, info in parsed:
         filename = filepath.name
 
-        ctype, directory, suffix = detect_type(filename)
-        yyyy, mmdd, date_fmt, file_suffix = extract_date(filename)
-
-        if not ctype or not yyyy:
+        if info is None:
             print(f"⚠️  Cannot parse, skipping: {filename}")
             continue
 
-        with open(filepath, "r") as f:
-            html = f.read()
-
-        keywords = extract_keywords(html, ctype)
+        ctype, directory, suffix = info["type"], info["directory"], info["suffix"]
+        yyyy, mmdd, date_fmt = info["yyyy"], info["mmdd"], info["date_formatted"]
+        file_suffix, html, keywords = info["file_suffix"], info["html"], info["keywords"]
         deploy_path = f"{directory}/{yyyy}/{mmdd}{suffix}{file_suffix}.html"
 
         # ── Zzal: copy to repo/zzal/ + PNG 생성 + Instagram (웹 인덱스는 스킵) ──
@@ -1179,7 +1335,7 @@ def main():
 
             dest = REPO / deploy_path
             dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(filepath, dest)
+            shutil.copyfile(filepath, dest)
             print(f"🎴 {filename} → {deploy_path}")
 
             # Auto-pack: run pack_zzal.py on the source file before PNG capture
@@ -1193,10 +1349,9 @@ def main():
                 )
                 if result.returncode == 0:
                     # pack_zzal.py overwrites the input file — re-copy to dest
-                    shutil.copy2(filepath, dest)
+                    shutil.copyfile(filepath, dest)
                     # Re-read html (pack changed it)
-                    with open(filepath) as f:
-                        html = f.read()
+                    html = filepath.read_bytes().decode("utf-8")
                     for line in result.stdout.strip().split('\n'):
                         print(f"  {line}")
                 else:
@@ -1210,7 +1365,7 @@ def main():
                 "yyyy": yyyy, "mmdd": mmdd,
                 "date_formatted": date_fmt, "keywords": keywords,
                 "deploy_path": deploy_path, "png_paths": png_paths,
-                "html": html,
+                "html": html, "order": len(ORDER),  # zzal은 today-grid에 없음 → 맨 뒤
             })
             continue
 
@@ -1218,7 +1373,8 @@ def main():
         # Copy file to repo
         dest = REPO / deploy_path
         dest.parent.mkdir(parents=True, exist_ok=True)
-        shutil.copy2(filepath, dest)
+        shutil.copyfile(filepath, dest)
+        _keyword_cache[dest.resolve()] = keywords
 
         # Inject Cloudflare Web Analytics beacon
         inject_analytics_beacon(dest)
@@ -1244,6 +1400,7 @@ def main():
                 "deploy_path": deploy_path,
                 "png_paths": png_paths,
                 "html": html if ctype in CARDNEWS_TYPES else "",
+                "order": ORDER[ctype],
             }
         )
 
@@ -1255,6 +1412,9 @@ def main():
     if not instagram_only:
         site_items = [i for i in items if i["type"] not in ZZAL_TYPES]
         dates = sorted(set(i["date_formatted"] for i in site_items))
+        main_index = REPO / "index.html"
+        main_content = main_index.read_bytes().decode("utf-8") if dates else None
+        by_dir = defaultdict(list)
         for date_fmt in dates:
             date_items = [i for i in site_items if i["date_formatted"] == date_fmt]
             if not date_items:
@@ -1264,10 +1424,18 @@ def main():
             has_briefing = any(i["type"] == "briefing" for i in date_items)
 
             print(f"\n🔧 Updating indexes for {date_fmt}...")
-            update_main_index(date_items, date_fmt, has_briefing, yyyy, mmdd)
+            main_content = apply_main_index_edits(main_content, date_items, date_fmt, has_briefing, yyyy, mmdd)
 
             for item in date_items:
-                update_archive_index(item)
+                by_dir[item["directory"]].append(item)
+
+        if main_content is not None:
+            main_index.write_bytes(main_content.encode("utf-8"))
+            print("  ✅ index.html")
+
+        # 아카이브 인덱스는 디렉터리별로 한 번만 읽고 한 번만 씀
+        for directory, dir_items in by_dir.items():
+            update_archive_index(directory, dir_items)
 
     # ── Git commit & push (zzal은 웹사이트 배포 없으므로 제외) ──
     site_items = [i for i in items if i["type"] not in ZZAL_TYPES]
@@ -1278,13 +1446,24 @@ def main():
     else:
         print("\n🚀 Committing...")
         # sitemap/rss/robots 갱신 (실패해도 배포는 계속)
-        subprocess.run([sys.executable, str(Path(__file__).parent / "scripts" / "generate_seo.py")], check=False)
+        seo_script = Path(__file__).parent / "scripts" / "generate_seo.py"
+        subprocess.run([sys.executable, str(seo_script)], check=False)
 
         names = [LABELS.get(i["type"]) or i["keywords"][:30] for i in site_items]
         mmdd = site_items[0]["mmdd"]
         msg = f"Add {' & '.join(names)} {mmdd}"
 
-        if git_sync_push(msg):                          # rebase-retry: 동시 push에도 안전
+        # 이번 배포가 실제로 쓴 파일만 add (git add -A의 워크트리 전체 lstat 회피).
+        # generate_seo.py가 실행됐으면 출력 파일 목록을 알 수 없으므로 기존처럼 전체 add.
+        changed_paths = None
+        if not seo_script.exists():
+            changed_paths = [i["deploy_path"] for i in items]
+            changed_paths.append("index.html")
+            changed_paths += [f"{i['directory']}/index.html" for i in site_items]
+            # 카드뉴스·짤 PNG(<stem>_png/) — CI 새 클론에서도 재사용되도록 함께 커밋
+            changed_paths += [str(p.parent) for i in items for p in i.get("png_paths", [])]
+
+        if git_sync_push(msg, paths=changed_paths):                          # rebase-retry: 동시 push에도 안전
             print(f"\n✨ Site deployed! {msg}")
             # plantree 즉시 흡수 — Mac의 gh 인증 재사용, 실패해도 배포는 계속
             r = subprocess.run(["gh", "api", "repos/kdvol/plantree/dispatches",